@@ -1,6 +1,4 @@
-import fastf1
 import f1_strategy_simulator.common.helpers as helpers
-import f1_strategy_simulator.common.names as n
 from f1_strategy_simulator.common.enums import NumberOfLaps, PitStopTimeLoss
 from dataclasses import dataclass
 
@@ -30,21 +28,16 @@ def simulate_race(
             - compounds: List of tyre compounds used in the strategy
                  (e.g., ['SOFT', 'HARD'])
     """
-    session = fastf1.get_session(year=year, gp=race, identifier=n.RACE)
-    session.load()
-
     number_of_laps = NumberOfLaps.from_name(race)
     pit_stop_time_loss = PitStopTimeLoss.from_name(race)
 
-    # calculate tyre degradation for each compound
-    tyre_degs, avg_lap_times = calculate_tyre_degradation_and_avg_lap_times(
+    # calculate tyre degradation and average lap time for each compound
+    compound_data = calculate_tyre_degradation_and_avg_lap_times(
         driver, race, year, strategies
     )
 
     total_race_times = {}
     for strategy in strategies:
-        total_race_time = 0.0
-
         stop_laps = strategy.stop_laps
         compounds = strategy.compounds
 
@@ -56,15 +49,13 @@ def simulate_race(
             number_of_laps - stop_laps[-1] if stop_laps else number_of_laps
         )
 
+        total_race_time = 0.0
         # now multiply avg lap times by stint lengths
         for i, (compound, stint_len) in enumerate(zip(compounds, stint_lengths)):
-            total_stint_time = calculate_total_stint_time(
-                avg_lap_times[strategy.name][compound],
-                tyre_deg=tyre_degs[strategy.name][compound],
-                stint_len=stint_len,
+            tyre_deg, avg_lap_time = compound_data[compound]
+            total_race_time += calculate_total_stint_time(
+                avg_lap_time, tyre_deg=tyre_deg, stint_len=stint_len
             )
-
-            total_race_time += total_stint_time
             # add pit stop time loss if not the final stint
             if i != len(stint_lengths) - 1:
                 total_race_time += pit_stop_time_loss
@@ -75,39 +66,56 @@ def simulate_race(
 
 def calculate_tyre_degradation_and_avg_lap_times(
     driver: str, race: str, year: int, strategies: list[Strategy]
-) -> tuple[dict, dict]:
-    tyre_degs: dict[str, dict[str, float]] = {}
-    avg_lap_times: dict[str, dict[str, float]] = {}
-
-    compounds_cache = {}
-
-    for strategy in strategies:
-        strategy_name = strategy.name
-        tyre_degs[strategy_name] = {}
-        avg_lap_times[strategy_name] = {}
-
-        for compound in set(strategy.compounds):
-            if compound not in compounds_cache:
-                compounds_cache[compound] = {
-                    n.TYRE_DEG: helpers.calculate_tyre_degradation(
-                        driver=driver, race=race, year=year, compound=compound
-                    ),
-                    n.AVG_LAP_TIME: helpers.calculate_avg_lap_time(
-                        race=race, year=year, compound=compound, driver=driver
-                    ),
-                }
+) -> dict[str, tuple[float, float]]:
+    """
+    Calculates the tyre degradation and average lap time once for every
+    compound used by the given strategies.
 
-            tyre_degs[strategy_name][compound] = compounds_cache[compound][n.TYRE_DEG]
-            avg_lap_times[strategy_name][compound] = compounds_cache[compound][
-                n.AVG_LAP_TIME
-            ]
+    Args:
+        driver (str): Driver code (e.g., 'HAM' for Lewis Hamilton)
+        race (str): Country name of race (e.g., 'Monaco')
+        year (int): Year of the simulated tyre degradation
+        strategies (list(Strategy)): Strategies whose compounds to analyze
+    Returns:
+        dict: (tyre degradation, average lap time) in seconds per compound
+    """
+    # the reference race only depends on the driver, race and year, so it is
+    # loaded once and shared by all compounds
+    cleaned_session = helpers.get_last_race_without_rain(
+        race=race, year=year - 1, driver=driver
+    )
 
-    return tyre_degs, avg_lap_times
+    all_compounds = {
+        compound for strategy in strategies for compound in strategy.compounds
+    }
+    return {
+        compound: (
+            helpers.calculate_tyre_degradation_from_df(
+                cleaned_session, compound=compound, driver=driver, race=race, year=year
+            ),
+            helpers.calculate_avg_lap_time_from_df(cleaned_session, compound=compound),
+        )
+        for compound in all_compounds
+    }
 
 
 def calculate_total_stint_time(
     avg_lap_time: float, tyre_deg: float, stint_len: int
 ) -> float:
+    """
+    Calculates the total time of a stint in seconds.
+
+    Lap times grow linearly with the tyre degradation, so the stint time is
+    the sum of an arithmetic series and is computed in closed form instead
+    of lap by lap.
+
+    Args:
+        avg_lap_time (float): Average lap time in seconds on the compound
+        tyre_deg (float): Tyre degradation in seconds per lap
+        stint_len (int): Number of laps in the stint
+    Returns:
+        float: Total stint time in seconds
+    """
     return stint_len * avg_lap_time + tyre_deg * (stint_len * (stint_len - 1) / 2)
 
 
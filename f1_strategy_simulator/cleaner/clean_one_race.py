@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from fastf1.core import Session
 from fastf1.core import Laps
@@ -21,15 +22,17 @@ def clean_race_data(session: Session, driver: str) -> pd.DataFrame:
     else:
         laps = session.laps  # all drivers
 
+    # Narrow dtypes; stint, tyre life and position can be missing in
+    # FastF1 data, so they stay floats instead of integers
     df = pd.DataFrame(
         {
-            "driver": laps["Driver"],
-            "lap_number": laps["LapNumber"],
-            "lap_time_s": laps["LapTime"].dt.total_seconds(),
-            "stint": laps["Stint"],
-            "compound": laps["Compound"],
-            "tyre_life": laps["TyreLife"],
-            "position": laps["Position"],
+            "driver": laps["Driver"].astype("category"),
+            "lap_number": laps["LapNumber"].astype(np.int16),
+            "lap_time_s": laps["LapTime"].dt.total_seconds().astype(np.float32),
+            "stint": laps["Stint"].astype(np.float32),
+            "compound": laps["Compound"].astype("category"),
+            "tyre_life": laps["TyreLife"].astype(np.float32),
+            "position": laps["Position"].astype(np.float32),
             "pit_stop_in_lap": laps["PitInTime"].notna(),
             "pit_stop_out_lap": laps["PitOutTime"].notna(),
         }
@@ -49,22 +52,26 @@ def _expand_track_statuses(laps: Laps, df: pd.DataFrame) -> pd.DataFrame:
     # Expand TrackStatus into binary columns
     status_dummies = TrackStatus.expand_statuses(laps["TrackStatus"])
 
-    # Concatenate side by side
-    df = pd.concat([df, status_dummies], axis=1)
+    # Add the columns in place; both frames share the laps index
+    for col in status_dummies.columns:
+        df[col] = status_dummies[col].to_numpy()
 
     return df
 
 
 def _approximate_empty_lap_times(laps: Laps, df: pd.DataFrame) -> pd.DataFrame:
     """Approximate missing lap times using telemetry data."""
-    laps["lap_time_approx_s"] = laps["LapTime"].copy()
+    df["lap_time_approx_s"] = df["lap_time_s"]
 
-    def _approx_lap_time(lap):
-        """Replace NaN lap times with telemetry-based estimates"""
-        if pd.isna(lap.LapTime):
-            telem = lap.get_telemetry()
-            return (telem["Time"].max() - telem["Time"].min()).total_seconds()
-        return lap["LapTime"]
+    # only laps without a lap time need a telemetry-based estimate
+    nan_idx = laps.index[laps["LapTime"].isna()]
+    if nan_idx.empty:
+        return df
 
-    df["lap_time_approx_s"] = [_approx_lap_time(lap) for _, lap in laps.iterlaps()]
+    approx = {}
+    for i in nan_idx:
+        telem = laps.loc[i].get_telemetry()
+        approx[i] = (telem["Time"].max() - telem["Time"].min()).total_seconds()
+
+    df.loc[list(approx), "lap_time_approx_s"] = list(approx.values())
     return df
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import f1_strategy_simulator.common.helpers as h
 
@@ -18,14 +19,14 @@ class TrackStatus(Enum):
         # make sure we're working with strings
         as_str = series.astype(str).fillna("")
 
-        result = pd.DataFrame(index=series.index)
+        columns = {
+            status.name: as_str.str.contains(str(status.value), regex=False).to_numpy(
+                dtype=np.int8
+            )
+            for status in cls  # iterate over Enum members
+        }
 
-        for status in cls:  # iterate over Enum members
-            result[status.name] = as_str.apply(
-                lambda code: str(status.value) in code
-            ).astype(int)
-
-        return result
+        return pd.DataFrame(columns, index=series.index)
 
 
 class PitStopTimeLoss(Enum):
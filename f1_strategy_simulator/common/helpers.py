@@ -2,9 +2,10 @@ import fastf1
 from fastf1.core import Session
 
 import numpy as np
-import scipy.stats as stats
 import pandas as pd
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from f1_strategy_simulator.cleaner import clean_one_race
 import f1_strategy_simulator.common.names as n
@@ -30,51 +31,85 @@ def calculate_tyre_degradation(
         race=race, year=year - 1, driver=driver
     )
 
-    compound_laps = _filter_valid_laps(cleaned_session, compound)
+    return calculate_tyre_degradation_from_df(
+        cleaned_session, compound, driver=driver, race=race, year=year
+    )
 
-    # group by stints
-    stints = compound_laps.groupby("stint")
 
-    slopes = [
-        stats.linregress(
-            stint_data["lap_number"].astype(float),
-            stint_data["lap_time_approx_s"].apply(lambda x: x.total_seconds()),
-        ).slope
-        for _, stint_data in stints
-        if len(stint_data) >= 3
-    ]
+def calculate_tyre_degradation_from_df(
+    cleaned_session: pd.DataFrame, compound: str, driver: str, race: str, year: int
+) -> float:
+    """
+    Calculate the tyre degradation for a compound from already cleaned
+    race data.
+    Args:
+        cleaned_session (pd.DataFrame): Cleaned race data, as returned by
+            get_last_race_without_rain
+        compound (str): Tyre compound to analyze (e.g., 'MEDIUM')
+        driver (str): Driver code of the cleaned data, for logging
+        race (str): Race name of the cleaned data, for logging
+        year (int): Year of the simulated tyre degradation, for logging
+    Returns:
+        float: Average tyre degradation in seconds per lap
+    """
+    compound_laps = _filter_valid_laps(cleaned_session, compound)
+    compound_laps = compound_laps[compound_laps["lap_time_approx_s"].notna()]
+
+    # least-squares slope per stint from per-stint sums, so all stints are
+    # fitted in one groupby pass
+    x = compound_laps["lap_number"].to_numpy(dtype=np.float64)
+    y = compound_laps["lap_time_approx_s"].to_numpy(dtype=np.float64)
+    sums = (
+        pd.DataFrame(
+            {"n": 1, "x": x, "y": y, "xx": x * x, "xy": x * y},
+            index=compound_laps.index,
+        )
+        .groupby(compound_laps["stint"])
+        .sum()
+    )
+    sums = sums[sums["n"] >= 3]
 
-    if not slopes:
+    if sums.empty:
         logging.warning(
             f"No valid stints for driver={driver}, race={race}, year={year}, "
             f"compound={compound}"
         )
         return np.nan
 
-    return np.mean(slopes) + c.FUEL_CORRECTION_SECONDS
+    slopes = (sums["xy"] - sums["x"] * sums["y"] / sums["n"]) / (
+        sums["xx"] - sums["x"] ** 2 / sums["n"]
+    )
+
+    return slopes.mean() + c.FUEL_CORRECTION_SECONDS
 
 
 def _filter_valid_laps(df: pd.DataFrame, compound: str) -> pd.DataFrame:
     """Filters laps for a given compound, excluding pit laps,
     first lap, and race interruptions."""
-    mask = (
-        (df["compound"] == compound)
-        & (~df["pit_stop_in_lap"])
-        & (~df["pit_stop_out_lap"])
-        & (df["lap_number"] != 1)
-        & (df["RED_FLAG"] == 0)
-        & (df["YELLOW"] == 0)
-        & (df["SAFETY_CAR"] == 0)
-        & (df["VIRTUAL_SAFETY_CAR"] == 0)
-        & (df["VSC_ENDING"] == 0)
+    mask = np.logical_and.reduce(
+        [
+            (df["compound"] == compound).to_numpy(),
+            ~df["pit_stop_in_lap"].to_numpy(),
+            ~df["pit_stop_out_lap"].to_numpy(),
+            df["lap_number"].to_numpy() != 1,
+            df["RED_FLAG"].to_numpy() == 0,
+            df["YELLOW"].to_numpy() == 0,
+            df["SAFETY_CAR"].to_numpy() == 0,
+            df["VIRTUAL_SAFETY_CAR"].to_numpy() == 0,
+            df["VSC_ENDING"].to_numpy() == 0,
+        ]
     )
     return df[mask].copy()
 
 
+@lru_cache(maxsize=None)
 def get_last_race_without_rain(race: str, year: int, driver: str) -> Session:
     """
     Finds the last requested race before the given year that was not
     affected by rain and returns cleaned race data for the specified driver.
+    Results are cached per (race, year, driver) without a size limit, so
+    preloaded sessions are never evicted; callers must not modify the
+    returned data in place.
     Args:
         race (str): Race name (e.g. 'Monaco')
         year (int): Year to start the search from
@@ -86,11 +121,19 @@ def get_last_race_without_rain(race: str, year: int, driver: str) -> Session:
     max_year_limit = 1950  # Formula 1 started in 1950
     while year >= max_year_limit:
         session_previous_year = fastf1.get_session(year, race, n.RACE)
-        session_previous_year.load()
+        # the rain check only needs lap data, so skip the heavy telemetry
+        session_previous_year.load(
+            laps=True, telemetry=False, weather=False, messages=False
+        )
         driver_laps_previous_year = session_previous_year.laps
         if driver_laps_previous_year["Compound"].isin(wet_compounds).any():
             year -= 1
         else:
+            # telemetry is used to approximate missing lap times, so only
+            # load it for the chosen session
+            session_previous_year.load(
+                laps=False, telemetry=True, weather=False, messages=False
+            )
             cleaned_session = clean_one_race.clean_race_data(
                 session=session_previous_year, driver=driver
             ).reset_index(drop=True)
@@ -102,6 +145,38 @@ def get_last_race_without_rain(race: str, year: int, driver: str) -> Session:
     )
 
 
+def preload_sessions(
+    jobs: list[tuple[str, int, str]], max_workers: int = 8
+) -> dict[tuple[str, int, str], pd.DataFrame]:
+    """
+    Loads the cleaned race data for several (race, year, driver) jobs in
+    parallel and fills the get_last_race_without_rain cache, so later
+    lookups for the same jobs are free. FastF1 loads are I/O bound, so
+    threads are enough to overlap them. Duplicate jobs are loaded once.
+    Args:
+        jobs (list(tuple)): (race, year, driver) tuples, with the same
+            arguments as get_last_race_without_rain
+        max_workers (int): Maximum number of sessions loaded at once
+    Returns:
+        dict: Copies of the cleaned race data keyed by job
+    """
+    # the cache has no per-key lock, so equal jobs running at the same time
+    # would each load the session
+    unique_jobs = list(dict.fromkeys(jobs))
+
+    def _load(job: tuple[str, int, str]) -> pd.DataFrame:
+        race, year, driver = job
+        # keyword arguments so the cache key matches the other callers
+        return get_last_race_without_rain(race=race, year=year, driver=driver)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        cleaned_sessions = executor.map(_load, unique_jobs)
+        return {
+            job: cleaned_session.copy()
+            for job, cleaned_session in zip(unique_jobs, cleaned_sessions)
+        }
+
+
 def calculate_avg_lap_time(race: str, year: int, compound: str, driver: str) -> float:
     """
     Calculate the average lap time for a given driver, race, year, and compound.
@@ -117,16 +192,38 @@ def calculate_avg_lap_time(race: str, year: int, compound: str, driver: str) ->
         race=race, year=year - 1, driver=driver
     )
 
+    return calculate_avg_lap_time_from_df(cleaned_session, compound)
+
+
+def calculate_avg_lap_time_from_df(
+    cleaned_session: pd.DataFrame, compound: str
+) -> float:
+    """
+    Calculate the average lap time for a compound from already cleaned
+    race data.
+    Args:
+        cleaned_session (pd.DataFrame): Cleaned race data, as returned by
+            get_last_race_without_rain
+        compound (str): Tyre compound to analyze (e.g., 'HARD', 'MEDIUM', 'SOFT')
+    Returns:
+        float: Average lap time in seconds for the specified compound
+    """
     stint_laps = cleaned_session[cleaned_session["compound"] == compound]
-    avg_lap_time = (
-        stint_laps["lap_time_approx_s"].apply(lambda x: x.total_seconds()).mean()
-    )
+    # widen the float32 column so the mean is accumulated in float64
+    avg_lap_time = float(stint_laps["lap_time_approx_s"].astype(np.float64).mean())
     return avg_lap_time
 
 
 # Enum helpers
 def enum_from_race_name(enum_cls, race: str):
     try:
-        return enum_cls[race.replace(" ", "_").upper()].value
+        return _values_by_name(enum_cls)[race.replace(" ", "_").upper()]
     except KeyError:
         raise ValueError(f"Race not found: {race}")
+
+
+@lru_cache(maxsize=None)
+def _values_by_name(enum_cls) -> dict:
+    """Member values keyed by member name, built once per enum class.
+    Uses __members__ so that aliases (races sharing a value) are included."""
+    return {name: member.value for name, member in enum_cls.__members__.items()}
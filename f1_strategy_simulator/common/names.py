@@ -1,3 +1 @@
 RACE = "race"
-TYRE_DEG = "tyre_deg"
-AVG_LAP_TIME = "avg_lap_time"